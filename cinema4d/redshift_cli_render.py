@@ -4,20 +4,56 @@
 # 25FPS DEFAULT
 # SUPPORTS WIN-UNC PATHS
 
+import asyncio
+import codecs
+import collections
+import concurrent.futures
+import functools
 import json
 import os
+import queue
 import shlex
 import subprocess
 import sys
+import tempfile
 import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+# OPTIONAL: FASTER PRESET JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 APP_TITLE = "REDSHIFT CLI BUT IN A GUI"
+READ_CHUNK = 65536  # BYTES PER PIPE READ
+LOG_POLL_MS = 50  # TK LOG REFRESH INTERVAL
+LOG_DRAIN_MAX = 1000  # MAX QUEUED ITEMS PER REFRESH
+LOG_MAX_LINES = 5000  # LINES KEPT IN THE LOG WIDGET (FULL LOG GOES TO A TEMP FILE)
+LOG_TAIL_MS = 100  # LOG-TO-FILE TAIL INTERVAL
+LOG_FILE_BUFFER = 1 << 20
 DEFAULT_FPS = 25
 DEFAULT_FORMAT = "png"  # png | exr | tif | jpg
 PRESET_EXT = ".c4drs.json"
 
+_IS_WIN = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+# SPAWN: NO CONSOLE + HIGHER PRIORITY ON WIN, OWN SESSION + NO INHERITED FDS ELSEWHERE
+if _IS_WIN:
+    _SPAWN_KWARGS = {"creationflags": subprocess.CREATE_NO_WINDOW | subprocess.HIGH_PRIORITY_CLASS}
+else:
+    _SPAWN_KWARGS = {"start_new_session": True, "close_fds": True}
+
+if orjson:
+    def _dumps(d):
+        return orjson.dumps(d, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+else:
+    def _dumps(d):
+        return json.dumps(d, indent=2).encode("utf-8")
+    _loads = json.loads
+
 class RenderConfig:
     def __init__(self):
         self.c4d_cmd = guess_c4d_command()
@@ -38,9 +74,15 @@ class RenderConfig:
         self.force_renderer = True
         self.threads = 0  # 0 = all
         self.extra_args = ""  # advanced users
+        self.log_to_file = False  # RENDER WRITES STRAIGHT TO THE LOG FILE (NO PIPE)
+        self._total_frames = None  # DERIVED IN App.sync_cfg (NOT SAVED)
 
     def to_dict(self):
-        return self.__dict__.copy()
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
+    def key(self):
+        # HASHABLE SNAPSHOT OF KNOWN FIELDS (PRESETS MAY CARRY EXTRA/UNHASHABLE KEYS)
+        return tuple(getattr(self, k) for k in _cfg_fields())
 
     @staticmethod
     def from_dict(d):
@@ -48,26 +90,38 @@ class RenderConfig:
         cfg.__dict__.update(d)
         return cfg
 
+@functools.lru_cache(maxsize=1)
+def _cfg_fields():
+    return tuple(RenderConfig().to_dict())
+
+#NOTE:  [!] SET YOUR RENDER PATH HERE [!] 
+_WIN_CANDIDATES = (
+    r"C:\Program Files\Maxon Cinema 4D 2025\Commandline.exe",
+    r"C:\Program Files\Maxon Cinema 4D 2024\Commandline.exe",
+    r"C:\Program Files\Maxon Cinema 4D R26\Commandline.exe",
+)
+_MAC_CANDIDATES = (
+    "/Applications/Maxon Cinema 4D 2025/Commandline.app/Contents/MacOS/Commandline",
+    "/Applications/Maxon Cinema 4D 2024/Commandline.app/Contents/MacOS/Commandline",
+    "/Applications/Maxon Cinema 4D R26/Commandline.app/Contents/MacOS/Commandline",
+)
+
+@functools.lru_cache(maxsize=1)  # INSTALLS DON'T MOVE MID-SESSION; PROBE ONCE
 def guess_c4d_command():
-    #NOTE:  [!] SET YOUR RENDER PATH HERE [!] 
-    candidates = []
-    if sys.platform.startswith("win"):
-        candidates += [
-            r"C:\Program Files\Maxon Cinema 4D 2025\Commandline.exe",
-            r"C:\Program Files\Maxon Cinema 4D 2024\Commandline.exe",
-            r"C:\Program Files\Maxon Cinema 4D R26\Commandline.exe",
-        ]
-    elif sys.platform == "darwin":
-        candidates += [
-            "/Applications/Maxon Cinema 4D 2025/Commandline.app/Contents/MacOS/Commandline",
-            "/Applications/Maxon Cinema 4D 2024/Commandline.app/Contents/MacOS/Commandline",
-            "/Applications/Maxon Cinema 4D R26/Commandline.app/Contents/MacOS/Commandline",
-        ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
+    candidates = _WIN_CANDIDATES if _IS_WIN else _MAC_CANDIDATES if _IS_MAC else ()
+    if not candidates:
+        return ""
+    # PROBE IN PARALLEL (SLOW NETWORK MOUNTS), KEEP LIST ORDER AS PRIORITY
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        for p, found in zip(candidates, pool.map(os.path.isfile, candidates)):
+            if found:
+                return p
     return ""
 
+@functools.lru_cache(maxsize=16)  # SAME STRING EVERY PREVIEW; SKIP RE-TOKENIZING
+def _split_extra(extra_args: str):
+    return tuple(shlex.split(extra_args, posix=not _IS_WIN))
+
 def build_command(cfg: RenderConfig):
     # BUILD COMMAND AS LIST
     cmd = [cfg.c4d_cmd] if cfg.c4d_cmd else []
@@ -97,7 +151,9 @@ def build_command(cfg: RenderConfig):
 
     # FRAMES
     if cfg.use_duration:
-        total_frames = int(round(cfg.duration_seconds * cfg.fps))
+        total_frames = cfg._total_frames
+        if total_frames is None:  # NOT SYNCED FROM UI
+            total_frames = int(round(cfg.duration_seconds * cfg.fps))
         start = 0
         end = total_frames
         cmd += ["-frame", str(start), str(end)]
@@ -112,48 +168,95 @@ def build_command(cfg: RenderConfig):
     # EXTRA_ARGS
     if cfg.extra_args.strip():
         # QUOTED_FLAGS
-        cmd += shlex.split(cfg.extra_args, posix=not sys.platform.startswith("win"))
+        cmd += _split_extra(cfg.extra_args)
 
-    # DISPLAY_STRING
-    pretty = " ".join(shlex.quote(x) if not sys.platform.startswith("win") else quote_win(x) for x in cmd)
+    # DISPLAY_STRING (LAZY: CALL pretty() ONLY WHEN SHOWN)
+    pretty = functools.partial(_format_cmd, tuple(cmd))
     return cmd, pretty
 
-def quote_win(s: str) -> str:
-    # WIN PATHS (WRAP IF SPACES OR BLACKSLASHES PRESENT)
-    if any(c.isspace() for c in s) or "\\" in s:
-        return f"\"{s}\""
-    return s
-
-def run_command_async(cmd, on_output, on_done):
-    # RUN IN BACKGROUND THREAD
-    def worker():
+@functools.lru_cache(maxsize=8)
+def _format_cmd(cmd: tuple) -> str:
+    # WIN: CommandLineToArgvW RULES (EMBEDDED QUOTES, TRAILING BACKSLASHES)
+    return subprocess.list2cmdline(cmd) if _IS_WIN else shlex.join(cmd)
+
+def _newlines(text):
+    # UNIVERSAL NEWLINES (AS text=True DID): \r\n AND LONE \r -> \n
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+def _pread(fd, n, offset):
+    # os.pread IS POSIX-ONLY
+    if hasattr(os, "pread"):
+        return os.pread(fd, n, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, n)
+
+async def _run(cmd, on_output, on_done, stdout=None):
+    try:
+        #NOTE: EXEC (NO SHELL) + LIST FOR PROPER QUOTING
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE if stdout is None else stdout,
+            stderr=asyncio.subprocess.STDOUT,
+            **_SPAWN_KWARGS,
+        )
+    except FileNotFoundError:
+        on_output("ERROR: Commandline executable not found.\n")
+        on_done(1)
+        return
+    except Exception as e:
+        on_output(f"ERROR: {e}\n")
+        on_done(1)
+        return
+
+    # NOTHING READS THE FUTURE: ANY FAILURE MUST STILL REPORT + CALL on_done
+    ret = 1
+    try:
+        # OUTPUT GOES STRAIGHT TO A FILE, NOTHING TO PUMP
+        if stdout is None:
+            # BLOCK READS, DECODE PER CHUNK (append_log STITCHES PARTIAL LINES)
+            decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            carry = ""
+            forward = True
+            while True:
+                chunk = await proc.stdout.read(READ_CHUNK)
+                text = carry + decoder.decode(chunk, final=not chunk)
+                # HOLD A TRAILING \r BACK IN CASE ITS \n IS IN THE NEXT CHUNK
+                carry = "\r" if chunk and text.endswith("\r") else ""
+                text = _newlines(text[:len(text) - len(carry)])
+                if text and forward:
+                    try:
+                        on_output(text)
+                    except Exception:
+                        # CALLBACK FAILURE MUST NOT KILL THE RENDER; KEEP DRAINING
+                        forward = False
+                if not chunk:
+                    break
+        ret = await proc.wait()
+    except Exception as e:
+        # PIPE READ ITSELF FAILED
         try:
-            #NOTE: USE `shell=False; pass list` FOR PROPER QUOTING
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-            )
-        except FileNotFoundError:
-            on_output("ERROR: Commandline executable not found.\n")
-            on_done(1)
-            return
-        except Exception as e:
             on_output(f"ERROR: {e}\n")
-            on_done(1)
-            return
-
-        ret = None
-        with proc.stdout:
-            for line in proc.stdout:
-                on_output(line)
-        ret = proc.wait()
+        except Exception:
+            pass
+        # NOBODY IS DRAINING THE PIPE ANYMORE; DON'T LEAVE IT BLOCKED
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    finally:
         on_done(ret)
 
-    t = threading.Thread(target=worker, daemon=True)
-    t.start()
+def run_command_async(cmd, on_output, on_done, loop, stdout=None):
+    # RUN ON THE APP'S BACKGROUND EVENT LOOP (CALLBACKS FIRE ON THAT THREAD)
+    return asyncio.run_coroutine_threadsafe(_run(cmd, on_output, on_done, stdout), loop)
+
+def _set_if_changed(var, value):
+    # SKIP NO-OP WRITES (EACH set() FIRES TRACES + REDRAW)
+    try:
+        if var.get() == value:
+            return
+    except tk.TclError:  # ENTRY HOLDS UNPARSABLE TEXT
+        pass
+    var.set(value)
 
 class App(tk.Tk):
     def __init__(self):
@@ -162,7 +265,30 @@ class App(tk.Tk):
         self.geometry("980x720")
         self.minsize(920, 640)
         self.cfg = RenderConfig()
+        self._last_cfg_key = None
+        self._last_built = None  # (cmd, pretty thunk) FOR _last_cfg_key
+        # WORKER -> UI (TK IS NOT THREAD-SAFE): STR = LOG TEXT, INT = EXIT CODE
+        self._log_queue = queue.SimpleQueue()  # C-LEVEL, NO CONDITION-VARIABLE BOOKKEEPING
+        self._log_lines = collections.deque(maxlen=LOG_MAX_LINES)
+        self._log_file = None  # FULL OUTPUT OF THE CURRENT RENDER
+        self._log_path = None  # LAST RENDER'S LOG (REMOVED ON NEXT RUN / EXIT)
+        self._tail_fd = None  # LOG-TO-FILE: READ SIDE + OFFSET + DECODER
+        self._tail_pos = 0
+        self._tail_decoder = None
+        self._tail_carry = ""
+        self._tail_after = None  # PENDING after() ID OF THE TAIL CHAIN
+        # ONE ASYNCIO LOOP OFF THE MAIN THREAD SERVES EVERY RENDER
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
         self.create_widgets()
+        self.after(LOG_POLL_MS, self._drain_log)
+
+    def destroy(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        # A RUNNING RENDER STILL OWNS ITS LOG FILE; ONLY CLEAN UP A FINISHED ONE
+        if self._log_file is None:
+            self._remove_log()
+        super().destroy()
 
     # UI_LAYOUT
     def create_widgets(self):
@@ -239,6 +365,7 @@ class App(tk.Tk):
         self.renderer_var = tk.StringVar(value=self.cfg.renderer)
         self.threads_var = tk.IntVar(value=self.cfg.threads)
         self.extra_args_var = tk.StringVar(value=self.cfg.extra_args)
+        self.log_to_file_var = tk.BooleanVar(value=self.cfg.log_to_file)
 
         adv_row1 = ttk.Frame(adv); adv_row1.pack(fill="x", pady=3)
         ttk.Checkbutton(adv_row1, text="Force Renderer", variable=self.force_renderer_var).pack(side="left")
@@ -246,6 +373,7 @@ class App(tk.Tk):
         ttk.Entry(adv_row1, textvariable=self.renderer_var, width=16).pack(side="left")
         ttk.Label(adv_row1, text="Threads (0=all):").pack(side="left", padx=(12,4))
         ttk.Entry(adv_row1, textvariable=self.threads_var, width=8).pack(side="left")
+        ttk.Checkbutton(adv_row1, text="Log to file (no pipe)", variable=self.log_to_file_var).pack(side="left", padx=(12,0))
 
         adv_row2 = ttk.Frame(adv); adv_row2.pack(fill="x", pady=3)
         ttk.Label(adv_row2, text="Extra args:").pack(side="left")
@@ -264,7 +392,8 @@ class App(tk.Tk):
         log_frame.pack(fill="both", expand=True)
         self.cmd_preview = tk.Text(log_frame, height=4, wrap="word")
         self.cmd_preview.pack(fill="x", padx=6, pady=6)
-        self.log = tk.Text(log_frame, height=16, wrap="word")
+        # undo=False IS THE TK DEFAULT; EXPLICIT SO NOBODY TURNS ON HISTORY FOR RENDER OUTPUT
+        self.log = tk.Text(log_frame, height=16, wrap="word", undo=False)
         self.log.pack(fill="both", expand=True, padx=6, pady=(0,6))
 
     def _row(self, parent, label, var, browse_btn=False, file=False):
@@ -305,21 +434,31 @@ class App(tk.Tk):
         c.renderer = self.renderer_var.get().strip() or "Redshift"
         c.threads = int(self.threads_var.get())
         c.extra_args = self.extra_args_var.get()
+        c.log_to_file = self.log_to_file_var.get()
+        c._total_frames = int(round(c.duration_seconds * c.fps)) if c.use_duration else None
         return c
 
+    def _build_cached(self):
+        # REBUILD ONLY WHEN A FIELD ACTUALLY CHANGED
+        cfg = self.sync_cfg()
+        key = cfg.key()
+        if key != self._last_cfg_key:
+            self._last_built = build_command(cfg)
+            self._last_cfg_key = key
+        cmd, pretty = self._last_built
+        return cfg, cmd, pretty
+
     def on_preview(self):
         try:
-            cfg = self.sync_cfg()
-            _, pretty = build_command(cfg)
+            _, _, pretty = self._build_cached()
             self.cmd_preview.delete("1.0", "end")
-            self.cmd_preview.insert("end", pretty + "\n")
+            self.cmd_preview.insert("end", pretty() + "\n")
         except Exception as e:
             messagebox.showerror("Build Error", str(e))
 
     def on_run(self):
         try:
-            cfg = self.sync_cfg()
-            cmd, pretty = build_command(cfg)
+            cfg, cmd, pretty = self._build_cached()
         except Exception as e:
             messagebox.showerror("Build Error", str(e))
             return
@@ -331,30 +470,131 @@ class App(tk.Tk):
             messagebox.showerror("Output Error", f"Cannot create output folder:\n{e}")
             return
 
-        self.cmd_preview.delete("1.0", "end")
-        self.cmd_preview.insert("end", pretty + "\n")
-        self.log.delete("1.0", "end")
-        self.run_btn.config(state="disabled")
-        self.append_log("Starting render…\n")
+        # FULL LOG ON DISK (WIDGET ONLY KEEPS THE TAIL); ONE AT A TIME
+        self._remove_log()
+        if cfg.log_to_file:
+            mode = {"mode": "wb", "buffering": LOG_FILE_BUFFER}
+        else:
+            mode = {"mode": "w", "encoding": "utf-8"}
+        try:
+            log_file = tempfile.NamedTemporaryFile(prefix="c4drs_", suffix=".log", delete=False, **mode)
+        except Exception as e:
+            messagebox.showerror("Output Error", f"Cannot create log file:\n{e}")
+            return
+        self._log_file = log_file
+        self._log_path = log_file.name
+
+        file_ok = True
 
         def on_output(text):
-            self.log.insert("end", text)
-            self.log.see("end")
-            self.update_idletasks()
+            nonlocal file_ok
+            self._log_queue.put(text)
+            if not file_ok:
+                return
+            # E.G. FULL TEMP DIR: DROP THE FILE, KEEP THE RENDER + WIDGET LOG
+            try:
+                log_file.write(text)
+            except (OSError, ValueError) as e:
+                file_ok = False
+                self._log_queue.put(f"\nWARNING: log file write failed ({e}), continuing without it.\n")
 
-        def on_done(code):
-            if code == 0:
-                self.append_log("\nRender completed successfully.\n")
-            else:
-                self.append_log(f"\nRender FAILED with exit code {code}.\n")
-            self.run_btn.config(state="normal")
+        self.cmd_preview.delete("1.0", "end")
+        self.cmd_preview.insert("end", pretty() + "\n")
+        self._log_lines.clear()
+        self.log.delete("1.0", "end")
+        self.run_btn.config(state="disabled")
+        self.append_log(f"Starting render… (full log: {log_file.name})\n")
+
+        if cfg.log_to_file:
+            # RENDER WRITES THE FILE DIRECTLY, TK TAILS IT
+            self._tail_fd = os.open(log_file.name, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            self._tail_pos = 0
+            self._tail_decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            self._tail_carry = ""
+            self._tail_after = self.after(LOG_TAIL_MS, self._tail_log)
+            run_command_async(cmd, self._log_queue.put, self._log_queue.put, self._loop, stdout=log_file)
+        else:
+            run_command_async(cmd, on_output, self._log_queue.put, self._loop)
+
+    def on_done(self, code):
+        if self._tail_after is not None:
+            self.after_cancel(self._tail_after)
+            self._tail_after = None
+        if self._tail_fd is not None:
+            self._read_tail(final=True)
+            os.close(self._tail_fd)
+            self._tail_fd = None
+        if self._log_file:
+            self._log_file.close()
+            self._log_file = None
+        if code == 0:
+            self.append_log("\nRender completed successfully.\n")
+        else:
+            self.append_log(f"\nRender FAILED with exit code {code}.\n")
+        self.run_btn.config(state="normal")
 
-        run_command_async(cmd, on_output, on_done)
+    def _remove_log(self):
+        if self._log_path:
+            try:
+                os.remove(self._log_path)
+            except OSError:
+                pass
+            self._log_path = None
 
     def append_log(self, text):
-        self.log.insert("end", text)
+        # KEEP LAST LOG_MAX_LINES, REDRAW WIDGET FROM THE RING BUFFER
+        lines = self._log_lines
+        parts = text.splitlines(keepends=True)
+        if parts and lines and not lines[-1].endswith("\n"):
+            lines[-1] += parts.pop(0)
+        lines.extend(parts)
+        self.log.delete("1.0", "end")
+        self.log.insert("end", "".join(lines))
         self.log.see("end")
 
+    def _tail_log(self):
+        self._tail_after = None
+        if self._tail_fd is None:
+            return
+        self._read_tail()
+        self._tail_after = self.after(LOG_TAIL_MS, self._tail_log)
+
+    def _read_tail(self, final=False):
+        # READ WHATEVER WAS APPENDED SINCE LAST OFFSET
+        chunks = []
+        while True:
+            chunk = _pread(self._tail_fd, READ_CHUNK, self._tail_pos)
+            if not chunk:
+                break
+            self._tail_pos += len(chunk)
+            chunks.append(chunk)
+        text = self._tail_carry + self._tail_decoder.decode(b"".join(chunks), final=final)
+        # HOLD A TRAILING \r BACK IN CASE ITS \n ISN'T WRITTEN YET
+        self._tail_carry = "\r" if not final and text.endswith("\r") else ""
+        text = _newlines(text[:len(text) - len(self._tail_carry)])
+        if text:
+            self.append_log(text)
+
+    def _drain_log(self):
+        # BATCH EVERYTHING QUEUED SINCE LAST TICK INTO ONE INSERT
+        batch = []
+        code = None
+        try:
+            for _ in range(LOG_DRAIN_MAX):
+                item = self._log_queue.get_nowait()
+                if isinstance(item, str):
+                    batch.append(item)
+                else:
+                    code = item
+                    break
+        except queue.Empty:
+            pass
+        if batch:
+            self.append_log("".join(batch))
+        if code is not None:
+            self.on_done(code)
+        self.after(LOG_POLL_MS, self._drain_log)
+
     def on_save_preset(self):
         cfg = self.sync_cfg()
         initial = os.path.splitext(os.path.basename(cfg.scene_path) or "preset")[0] + PRESET_EXT
@@ -367,8 +607,8 @@ class App(tk.Tk):
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(cfg.to_dict(), f, indent=2)
+            with open(path, "wb") as f:
+                f.write(_dumps(cfg.to_dict()))
             messagebox.showinfo("Preset Saved", f"Saved:\n{path}")
         except Exception as e:
             messagebox.showerror("Save Error", str(e))
@@ -381,8 +621,8 @@ class App(tk.Tk):
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = _loads(f.read())
             self.cfg = RenderConfig.from_dict(data)
             self._apply_cfg_to_ui()
             messagebox.showinfo("Preset Loaded", f"Loaded:\n{path}")
@@ -391,24 +631,25 @@ class App(tk.Tk):
 
     def _apply_cfg_to_ui(self):
         c = self.cfg
-        self.c4d_cmd_var.set(c.c4d_cmd)
-        self.scene_var.set(c.scene_path)
-        self.outdir_var.set(c.output_dir)
-        self.base_var.set(c.base_name)
-        self.override_fmt_var.set(c.override_format)
-        self.format_var.set(c.format)
-        self.override_res_var.set(c.override_res)
-        self.res_w_var.set(c.res_w)
-        self.res_h_var.set(c.res_h)
-        self.use_duration_var.set(c.use_duration)
-        self.duration_var.set(c.duration_seconds)
-        self.fps_var.set(c.fps or DEFAULT_FPS)
-        self.start_var.set(c.start_frame)
-        self.end_var.set(c.end_frame)
-        self.force_renderer_var.set(c.force_renderer)
-        self.renderer_var.set(c.renderer)
-        self.threads_var.set(c.threads)
-        self.extra_args_var.set(c.extra_args)
+        _set_if_changed(self.c4d_cmd_var, c.c4d_cmd)
+        _set_if_changed(self.scene_var, c.scene_path)
+        _set_if_changed(self.outdir_var, c.output_dir)
+        _set_if_changed(self.base_var, c.base_name)
+        _set_if_changed(self.override_fmt_var, c.override_format)
+        _set_if_changed(self.format_var, c.format)
+        _set_if_changed(self.override_res_var, c.override_res)
+        _set_if_changed(self.res_w_var, c.res_w)
+        _set_if_changed(self.res_h_var, c.res_h)
+        _set_if_changed(self.use_duration_var, c.use_duration)
+        _set_if_changed(self.duration_var, c.duration_seconds)
+        _set_if_changed(self.fps_var, c.fps or DEFAULT_FPS)
+        _set_if_changed(self.start_var, c.start_frame)
+        _set_if_changed(self.end_var, c.end_frame)
+        _set_if_changed(self.force_renderer_var, c.force_renderer)
+        _set_if_changed(self.renderer_var, c.renderer)
+        _set_if_changed(self.threads_var, c.threads)
+        _set_if_changed(self.extra_args_var, c.extra_args)
+        _set_if_changed(self.log_to_file_var, c.log_to_file)
 
 def main():
     app = App()